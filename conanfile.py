@@ -5,37 +5,142 @@ from conan.errors import ConanInvalidConfiguration
 from packaging import version
 import os
 import re
+import types
+
+# Recipe dotfiles are resolved against the recipe directory, not the cwd
+_RECIPE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_PATH = os.path.join(_RECIPE_DIR, '.project')
+_CPPSTD_PATH = os.path.join(_RECIPE_DIR, '.cppstd')
+
+# Defaults for any metadata missing from .project
+_PROJECT_DEFAULTS = types.MappingProxyType({
+    'PROJECT_NAME': 'cpp-conan-template',
+    'PROJECT_VERSION': '1.0.0',
+    'PROJECT_DESCRIPTION': 'Modern C++ project template with Conan 2.0',
+    'PROJECT_URL': 'https://github.com/yourusername/cpp-conan-template',
+    'PROJECT_LICENSE': 'MIT'
+})
+
+# KEY=value line of a .project file; blank lines and comments do not match
+_PROJECT_LINE_RE = re.compile(r'^\s*([^#=\s][^=]*?)\s*=\s*(.*?)\s*$')
+
+def _parse_project_file(path):
+    """Parse a .project file into a dict"""
+    config = {}
+    with open(path, 'r') as f:
+        for line in f:
+            m = _PROJECT_LINE_RE.match(line)
+            if m:
+                value = m.group(2)
+                # Remove matching surrounding quotes from value
+                if len(value) >= 2 and value[0] in '"\'' and value[-1] == value[0]:
+                    value = value[1:-1]
+                config[m.group(1)] = value
+    return config
+
+def _read_cppstd_file(path):
+    """Read the C++ standard from a .cppstd file"""
+    with open(path, 'r') as f:
+        return f.read().strip()
+
+def _load_recipe_dotfiles():
+    """Stat .project and .cppstd with one directory scan and return their parsed contents"""
+    found = set()
+    with os.scandir(_RECIPE_DIR) as entries:
+        for entry in entries:
+            if entry.path in (_PROJECT_PATH, _CPPSTD_PATH) and entry.is_file():
+                found.add(entry.path)
+    
+    # Missing files map to None
+    return {
+        '.project': _parse_project_file(_PROJECT_PATH) if _PROJECT_PATH in found else None,
+        '.cppstd': _read_cppstd_file(_CPPSTD_PATH) if _CPPSTD_PATH in found else None,
+    }
+
+# Recipe dotfiles, scanned once at import
+_RECIPE_DOTFILES = _load_recipe_dotfiles()
+
+# Warning raised while reading .project; emitted later through Conan's output
+_CONFIG_WARNING = None
+
+# Deferred warnings already emitted in this process
+_EMITTED_WARNINGS = set()
 
 def read_project_config():
     """Read project configuration from .project file"""
-    config = {}
-    try:
-        with open('.project', 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        # Remove quotes from value
-                        value = value.strip('"\'')
-                        config[key.strip()] = value
-    except FileNotFoundError:
-        print("WARNING: .project file not found, using defaults")
-        config = {
-            'PROJECT_NAME': 'cpp-conan-template',
-            'PROJECT_VERSION': '1.0.0',
-            'PROJECT_DESCRIPTION': 'Modern C++ project template with Conan 2.0',
-            'PROJECT_URL': 'https://github.com/yourusername/cpp-conan-template',
-            'PROJECT_LICENSE': 'MIT'
-        }
+    global _CONFIG_WARNING
+    config = _RECIPE_DOTFILES['.project']
+    if config is None:
+        _CONFIG_WARNING = ".project file not found, using defaults"
+        return dict(_PROJECT_DEFAULTS)
     return config
 
 # Read project configuration
-PROJECT_CONFIG = read_project_config()
+PROJECT_CONFIG = {**_PROJECT_DEFAULTS, **read_project_config()}
+
+# Package metadata resolved once for the recipe class body
+_NAME = PROJECT_CONFIG['PROJECT_NAME']
+_VERSION = PROJECT_CONFIG['PROJECT_VERSION']
+_DESCRIPTION = PROJECT_CONFIG['PROJECT_DESCRIPTION']
+_URL = PROJECT_CONFIG['PROJECT_URL']
+_LICENSE = PROJECT_CONFIG['PROJECT_LICENSE']
+
+# Minimum compiler versions required for each C++ standard
+_MIN_COMPILER_VERSIONS = {
+    "17": {
+        "gcc": "7",
+        "clang": "5", 
+        "msvc": "191",  # VS 2017
+        "apple-clang": "9.1"
+    },
+    "20": {
+        "gcc": "10",      # GCC 10 has good C++20 support
+        "clang": "12",    # Clang 12 has good C++20 support  
+        "msvc": "192",    # VS 2019 16.0
+        "apple-clang": "12"
+    },
+    "23": {
+        "gcc": "11",      # GCC 11+ for C++23 features
+        "clang": "14",    # Clang 14+ for C++23
+        "msvc": "193",    # VS 2022
+        "apple-clang": "14"
+    },
+    "26": {
+        "gcc": "13",      # Future-proofing for C++26
+        "clang": "16",    # Future estimates
+        "msvc": "194",    # Future VS version
+        "apple-clang": "15"
+    }
+}
+
+# Same table flattened to (compiler, std) -> parsed version, so only the compiler version is parsed at runtime
+_MIN_VERSION_FLAT = {
+    (compiler, std): version.parse(v)
+    for std, table in _MIN_COMPILER_VERSIONS.items()
+    for compiler, v in table.items()
+}
+
+def _min_compiler_version(compiler_name, cxx_std):
+    """Minimum compiler version for a C++ standard, or None for unknown compilers"""
+    # Unknown standards fall back to the C++20 requirements
+    std = cxx_std if cxx_std in _MIN_COMPILER_VERSIONS else "20"
+    return _MIN_VERSION_FLAT.get((compiler_name, std))
+
+# Core dependencies - these work with C++17+
+_CORE_REQUIRES = ("fmt/10.2.1", "spdlog/1.12.0")
+
+# Additional dependencies for Debug builds only
+_DEBUG_REQUIRES = ("catch2/3.4.0",)
+
+# Prefix for successful compiler support messages
+_CHECK_MARK = "✓"
+
+# Operating systems where fPIC does not apply
+_WINDOWS_LIKE = frozenset({"Windows", "WindowsStore", "WindowsCE"})
 
 class CppConanTemplateConan(ConanFile):
-    name = PROJECT_CONFIG.get('PROJECT_NAME', 'cpp-conan-template')
-    version = PROJECT_CONFIG.get('PROJECT_VERSION', '1.0.0')
+    name = _NAME
+    version = _VERSION
     package_type = "application"
     
     # Binary configuration
@@ -52,78 +157,72 @@ class CppConanTemplateConan(ConanFile):
     }
     
     # Package metadata from .project file
-    description = PROJECT_CONFIG.get('PROJECT_DESCRIPTION', 'Modern C++ project template with Conan 2.0')
+    description = _DESCRIPTION
     topics = ("cpp", "template", "conan")
-    url = PROJECT_CONFIG.get('PROJECT_URL', 'https://github.com/yourusername/cpp-conan-template')
-    license = PROJECT_CONFIG.get('PROJECT_LICENSE', 'MIT')
+    url = _URL
+    license = _LICENSE
     
-    def _get_min_compiler_version(self, cxx_std):
-        """Get minimum compiler versions required for each C++ standard"""
-        requirements = {
-            "17": {
-                "gcc": "7",
-                "clang": "5", 
-                "msvc": "191",  # VS 2017
-                "apple-clang": "9.1"
-            },
-            "20": {
-                "gcc": "10",      # GCC 10 has good C++20 support
-                "clang": "12",    # Clang 12 has good C++20 support  
-                "msvc": "192",    # VS 2019 16.0
-                "apple-clang": "12"
-            },
-            "23": {
-                "gcc": "11",      # GCC 11+ for C++23 features
-                "clang": "14",    # Clang 14+ for C++23
-                "msvc": "193",    # VS 2022
-                "apple-clang": "14"
-            },
-            "26": {
-                "gcc": "13",      # Future-proofing for C++26
-                "clang": "16",    # Future estimates
-                "msvc": "194",    # Future VS version
-                "apple-clang": "15"
-            }
-        }
-        return requirements.get(str(cxx_std), requirements["20"])
+    # Resolved C++ standard, filled lazily by _determine_cxx_standard
+    _cxx_std_cache = None
+    
+    # (compiler, version, cxx_std) -> supported, shared by every node in the process
+    _COMPILER_SUPPORT_CACHE = {}
     
     def _check_compiler_support(self, compiler_name, compiler_version, cxx_std):
-        """Check if compiler version supports the requested C++ standard"""
-        min_versions = self._get_min_compiler_version(cxx_std)
-        min_version = min_versions.get(compiler_name)
+        """Check if compiler version supports the requested C++ standard (all arguments are strings)"""
+        key = (compiler_name, compiler_version, cxx_std)
+        cached = self._COMPILER_SUPPORT_CACHE.get(key)
+        if cached is not None:
+            return cached
+        
+        min_version = _min_compiler_version(compiler_name, cxx_std)
         
-        if not min_version:
-            self.output.warn(f"Unknown compiler {compiler_name}, skipping version check")
+        if min_version is None:
+            self.output.warning(f"Unknown compiler {compiler_name}, skipping version check")
             return True
             
         try:
-            return version.parse(str(compiler_version)) >= version.parse(min_version)
+            supported = version.parse(compiler_version) >= min_version
         except Exception as e:
-            self.output.warn(f"Could not parse version {compiler_version}: {e}")
+            self.output.warning(f"Could not parse version {compiler_version}: {e}")
             return True  # Be permissive if we can't parse
+        
+        self._COMPILER_SUPPORT_CACHE[key] = supported
+        return supported
     
     def _determine_cxx_standard(self):
         """Determine the C++ standard to use based on options and compiler settings"""
+        if self._cxx_std_cache is None:
+            self._cxx_std_cache = self._resolve_cxx_standard()
+        return self._cxx_std_cache
+    
+    def _resolve_cxx_standard(self):
+        """Resolve the C++ standard without consulting the per-instance cache"""
         # First check if .cppstd file exists (managed by cpp_standard.sh)
-        try:
-            with open('.cppstd', 'r') as f:
-                std = f.read().strip()
-                if std in ["17", "20", "23", "26"]:
-                    return std
-        except FileNotFoundError:
-            pass
+        std = _RECIPE_DOTFILES['.cppstd']
+        if std in ["17", "20", "23", "26"]:
+            return std
         
         # Priority: explicit option > compiler.cppstd setting > default
-        if hasattr(self.options, 'cxx_standard') and self.options.cxx_standard:
+        if self.options.cxx_standard:
             return str(self.options.cxx_standard)
         
-        if hasattr(self.settings.compiler, "cppstd") and self.settings.compiler.cppstd:
-            return str(self.settings.compiler.cppstd)
+        cppstd = self.settings.get_safe("compiler.cppstd")
+        if cppstd:
+            return str(cppstd)
             
         return "20"  # Default fallback
     
+    def _is_debug(self):
+        """Whether this is a Debug build"""
+        return str(self.settings.build_type) == "Debug"
+    
     def configure(self):
-        if self.settings.os == "Windows":
+        if _CONFIG_WARNING and _CONFIG_WARNING not in _EMITTED_WARNINGS:
+            _EMITTED_WARNINGS.add(_CONFIG_WARNING)
+            self.output.warning(_CONFIG_WARNING)
+        
+        if str(self.settings.os) in _WINDOWS_LIKE:
             self.options.rm_safe("fPIC")
         
         # Determine target C++ standard
@@ -141,8 +240,7 @@ class CppConanTemplateConan(ConanFile):
         compiler_version = str(self.settings.compiler.version)
         
         if not self._check_compiler_support(compiler_name, compiler_version, target_cxx_std):
-            min_versions = self._get_min_compiler_version(target_cxx_std)
-            min_version = min_versions.get(compiler_name, "unknown")
+            min_version = _min_compiler_version(compiler_name, target_cxx_std)
             
             raise ConanInvalidConfiguration(
                 f"{compiler_name} {min_version}+ required for C++{target_cxx_std} support. "
@@ -150,16 +248,12 @@ class CppConanTemplateConan(ConanFile):
                 f"Consider using a lower C++ standard or updating your compiler."
             )
         
-        self.output.info(f"✓ {compiler_name} {compiler_version} supports C++{target_cxx_std}")
+        self.output.info(f"{_CHECK_MARK} {compiler_name} {compiler_version} supports C++{target_cxx_std}")
     
     def requirements(self):
-        # Core dependencies - these work with C++17+
-        self.requires("fmt/10.2.1")
-        self.requires("spdlog/1.12.0")
-        
-        # Optional dependencies based on build type
-        if self.settings.build_type == "Debug":
-            self.requires("catch2/3.4.0")
+        requires = _CORE_REQUIRES + _DEBUG_REQUIRES if self._is_debug() else _CORE_REQUIRES
+        for ref in requires:
+            self.requires(ref)
     
     def configure_dependencies(self):
         # Configure fmt
@@ -167,7 +261,7 @@ class CppConanTemplateConan(ConanFile):
         
         # Configure spdlog
         self.options["spdlog"].shared = self.options.shared
-        if self.settings.build_type == "Debug":
+        if self._is_debug():
             self.options["spdlog"].no_exceptions = False
     
     def layout(self):
@@ -179,25 +273,22 @@ class CppConanTemplateConan(ConanFile):
         deps.generate()
         
         tc = CMakeToolchain(self)
-        tc.variables["CMAKE_EXPORT_COMPILE_COMMANDS"] = True
-        
-        # Set C++ standard in CMake
         target_cxx_std = self._determine_cxx_standard()
-        tc.variables["CMAKE_CXX_STANDARD"] = target_cxx_std
-        tc.variables["CMAKE_CXX_STANDARD_REQUIRED"] = True
-        tc.variables["CMAKE_CXX_EXTENSIONS"] = False
-        
-        # Pass project configuration to CMake
-        tc.variables["PROJECT_NAME_FROM_CONAN"] = self.name
-        tc.variables["PROJECT_VERSION_FROM_CONAN"] = self.version
-        tc.variables["PROJECT_DESCRIPTION_FROM_CONAN"] = self.description
+        tc.variables.update({
+            "CMAKE_EXPORT_COMPILE_COMMANDS": True,
+            
+            # Set C++ standard in CMake
+            "CMAKE_CXX_STANDARD": target_cxx_std,
+            "CMAKE_CXX_STANDARD_REQUIRED": True,
+            "CMAKE_CXX_EXTENSIONS": False,
+            
+            # Pass project configuration to CMake
+            "PROJECT_NAME_FROM_CONAN": self.name,
+            "PROJECT_VERSION_FROM_CONAN": self.version,
+            "PROJECT_DESCRIPTION_FROM_CONAN": self.description,
+        })
         
-        # Add build type specific configurations
-        if self.settings.build_type == "Debug":
-            tc.variables["CMAKE_BUILD_TYPE"] = "Debug"
-            tc.variables["ENABLE_TESTING"] = True
-        else:
-            tc.variables["CMAKE_BUILD_TYPE"] = "Release"
-            tc.variables["ENABLE_TESTING"] = False
+        # CMAKE_BUILD_TYPE is derived from settings.build_type by CMakeToolchain
+        tc.variables["ENABLE_TESTING"] = self._is_debug()
                 
         tc.generate()